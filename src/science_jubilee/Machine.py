@@ -18,6 +18,13 @@ from science_jubilee.tools.Tool import Tool
 
 # TODO: Figure out how to print error messages from the Duet.
 
+# G-Code templates used to build the blocks sent with `Machine.send_block`
+_G0_XY = "G0 X{:.2f} Y{:.2f} F{:.2f}".format
+_G0_Z = "G0 Z{:.2f} F{:.2f}".format
+_G0_V = "G0 V{:.2f} F{:.2f}".format
+_G2_XY = "G2 X{:.2f} Y{:.2f} I{:.2f} J{:.2f}".format
+_G2_XYZ = "G2 X{:.2f} Y{:.2f} Z{:.2f} I{:.2f} J{:.2f}".format
+
 
 # copied from machine agency version, may not be needed here
 
@@ -103,6 +110,8 @@ class Machine:
     # where I keyboard interrupted during pipette tip pickup - tip was picked up but offset was not applied, crashing machine on next move. This should not be possible.
 
     LOCALHOST = "192.168.1.2"
+    # maximum number of characters sent in one request by `send_block`
+    MAX_BLOCK_LENGTH = 256
 
     def __init__(
         self,
@@ -810,6 +819,24 @@ class Machine:
 
         self._move_xyzev(x=dx, y=dy, z=dz, e=de, v=dv, s=s, param=param, wait=wait)
 
+    def move_to_xyz(self, x: float, y: float, z: float, s: float = 6000):
+        """Move to an absolute X/Y/Z position with a single request to the machine.
+
+        The X/Y move is completed before the Z move so that the tool does not travel diagonally
+        through labware, but both moves are sent together with :method:`send_block`.
+
+        :param x: x position on the bed, in whatever units have been set (default mm)
+        :type x: float
+        :param y: y position on the bed, in whatever units have been set (default mm)
+        :type y: float
+        :param z: z position on the bed, in whatever units have been set (default mm)
+        :type z: float
+        :param s: speed at which to move (default 6000 mm/min)
+        :type s: float, optional
+        """
+        self.send_block(["G90", _G0_XY(x, y, s), _G0_Z(z, s)])
+        self._absolute_positioning = True
+
     def dwell(self, t: float, millis: bool = True):
         """Pauses the machine for a period of time.
 
@@ -824,6 +851,59 @@ class Machine:
 
         self.gcode(cmd)
 
+    @machine_homed
+    def send_block(self, lines: list, timeout=None, response_wait: float = 30):
+        """Send several G-Code commands to the Machine in as few requests as possible.
+
+        The commands are joined into multi-line blocks so that the firmware can queue them
+        back to back in its motion planner instead of paying one round-trip per command.
+        Each request holds at most `MAX_BLOCK_LENGTH` characters, since the
+        block ends up in a URL when the Duet does not accept `POST` requests.
+        Positioning mode is not changed, so the block should include a `G90`/`G91` if needed.
+
+        :param lines: The G-Code commands to send, one command per item
+        :type lines: list[str]
+        :param timeout: The time to wait for a response from the machine, defaults to None
+        :type timeout: float, optional
+        :param response_wait: The time to wait for a response from the machine, defaults to 30
+        :type response_wait: float, optional
+        :raises MachineStateError: If the machine does not respond to one of the requests
+
+        :return: The aggregated response message from the machine
+        :rtype: str
+        """
+        if not lines:
+            return None
+        chunks = []
+        chunk = []
+        length = 0
+        for line in lines:
+            if chunk and length + len(line) > self.MAX_BLOCK_LENGTH:
+                chunks.append(chunk)
+                chunk = []
+                length = 0
+            chunk.append(line)
+            length += len(line) + len(self.lineEnding)
+        if chunk:
+            chunks.append(chunk)
+
+        responses = []
+        for chunk in chunks:
+            response = self.gcode(
+                self.lineEnding.join(chunk),
+                timeout=timeout,
+                response_wait=response_wait,
+            )
+            if response is None and not self.simulated:
+                raise MachineStateError(
+                    "Error: No response from the machine, the G-Code block may not have been completed."
+                )
+            responses.append(response)
+
+        if self.simulated:
+            return None
+        return self.lineEnding.join(responses)
+
     def safe_z_movement(self):
         """Move the Z axis to a safe height to avoid crashing into labware."""
         # TODO is this redundant? can we reuse decorator ?
@@ -8,6 +8,11 @@ from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
 
 import numpy as np
 
+# fields of a Well that the cached geometry of its labware is derived from
+_GEOMETRY_FIELDS = frozenset(
+    ("x", "y", "z", "depth", "diameter", "xDimension", "yDimension")
+)
+
 
 @dataclass
 class Well:
@@ -24,72 +29,31 @@ class Well:
     depth: float
     totalLiquidVolume: float
     shape: str
-    diameter: float = None
-    xDimension: float = None
-    yDimension: float = None
     x: float
     y: float
     z: float
+    diameter: float = None
+    xDimension: float = None
+    yDimension: float = None
     offset: Tuple[float] = None
     slot: int = None
     has_tip: bool = False
     clean_tip: bool = False
     labware_name: str = None
 
-    @property
-    def x(self):
-        """Offsets the x-position of the each well with respect to the deck-slot coordinates
+    def __post_init__(self):
+        """Stores the coordinates of the well as plain floats, since they are read on every move"""
+        self.x = float(self.x)
+        self.y = float(self.y)
+        self.z = float(self.z)
 
-        :return: The x-coordinate of the well
-        :rtype: float
-        """
-        return self._x
-
-    @x.setter
-    def x(self, new_x):
-        """Setter for the offsetted x-position of each well with respect to the deck-slot coordinates
-
-        :param new_x: the new y-coordinate of the well
-        :type new_x: float
-        """
-        self._x = new_x
-
-    @property
-    def y(self):
-        """Offsets the y-position of the each well with respect to the deck-slot coordinates
-
-        :return: The y-coordinate of the well
-        :rtype: float
-        """
-        return self._y
-
-    @y.setter
-    def y(self, new_y):
-        """Setter for the offsetted y-position of each well with respect to the deck-slot coordinates
-
-        :param new_y: The new y-coordinate of the well
-        :type new_y: float
-        """
-
-        self._y = new_y
-
-    @property
-    def z(self):
-        """Offsets the z-position of each well with respect to the deck-slot coordinates
-
-        :return: The z-coordinate of the well
-        :rtype: float
-        """
-        return self._z
-
-    @z.setter
-    def z(self, new_z):
-        """Setter for the offsetted z-position of each well with respect to the deck-slot coordinates
-
-        :param new_z: The new z-coordinate of the well
-        :type new_z: flaot
-        """
-        self._z = new_z
+    def __setattr__(self, name, value):
+        """Sets an attribute of the well and clears the cached geometry of its labware if needed"""
+        super().__setattr__(name, value)
+        if name in _GEOMETRY_FIELDS:
+            labware = self.__dict__.get("_labware")
+            if labware is not None:
+                labware._clear_cache()
 
     def apply_offset(self, offset: Tuple[float]):
         """Allows the user to offset the coordinates of the well with respect to the deck-slot coordinates
@@ -97,11 +61,11 @@ class Well:
         :param offset: A tuple of floats with the new offset of the well
         :type offset: Tuple[float]
         """
-        self._x = self.x + offset[0]
-        self._y = self.y + offset[1]
+        self.x = self.x + offset[0]
+        self.y = self.y + offset[1]
 
         if len(offset) == 3:
-            self._z = self.z + offset[2]
+            self.z = self.z + offset[2]
 
         self.offset = offset
 
@@ -213,6 +177,14 @@ class WellSet:
         """
         return str(f"{list(self.wells.keys())}")
 
+    def __iter__(self):
+        """Iterates over the :class:`Well` objects of the wellset in their current order
+
+        :return: An iterator over the :class:`Well` objects
+        :rtype: Iterator[:class:`Well`]
+        """
+        return iter(self.wells.values())
+
     def __getitem__(self, id_: Union[str, int]):
         """Allows the user to select a :class:`Well` object by either their :attribute:`Well.name` or
             their index in a :list:
@@ -277,6 +249,10 @@ class Labware(WellSet):
     :type path: str, optional
     """
 
+    # clearance in mm kept above the tallest well when moving between wells of the
+    # same labware
+    TRAVERSE_CLEARANCE = 10
+
     def __init__(
         self,
         labware_filename: str,
@@ -310,6 +286,7 @@ class Labware(WellSet):
             self.data = json.load(f)
 
         self.config_path = config_path
+        self._clear_cache()
         self.wells_data = self.data.get("wells", {})
         self.row_data, self.column_data, self.wells = self._create_rows_and_columns()
 
@@ -384,9 +361,10 @@ class Labware(WellSet):
                 well.has_tip = True
                 well.clean_tip = True
 
-        # add labware name to each Well object
+        # add labware name and a reference to the labware to each Well object
         for well in wells.values():
             well.labware_name = self.display_name
+            well._labware = self
 
         # Convert dictionary data to Row and Column classes
         _rows = {k: Row(identifier=k, wells=v) for k, v in rows.items()}
@@ -546,6 +524,74 @@ class Labware(WellSet):
         except:
             pass
 
+    def _clear_cache(self):
+        """Clears the values derived from the well coordinates, so that they are recomputed on next access"""
+        self._xyz_array = None
+        self._bbox = None
+        self._safe_traverse_z = None
+
+    @property
+    def xyz_array(self):
+        """Returns the (x, y, z) coordinates of all the wells in the labware, in well order
+
+        The array is built on first access and rebuilt after a well moves or the well order changes.
+
+        :return: An array of shape (number of wells, 3)
+        :rtype: :class:`numpy.ndarray`
+        """
+        if self._xyz_array is None:
+            self._xyz_array = np.array(
+                [(w.x, w.y, w.z) for w in self], dtype=np.float64
+            ).reshape(-1, 3)
+        return self._xyz_array
+
+    @property
+    def bbox(self):
+        """Returns the bounding box of the labware in the xy-plane, computed from the edges of its wells
+
+        The bounding box is computed on first access and recomputed after the position or size of a well changes.
+
+        :return: A tuple with the (x, y) coordinates of the lower-left and upper-right corners
+        :rtype: Tuple[Tuple[float], Tuple[float]]
+        """
+        if self._bbox is not None:
+            return self._bbox
+        x_min = y_min = float("inf")
+        x_max = y_max = float("-inf")
+        for w in self:
+            if w.diameter is not None:
+                dx = dy = w.diameter / 2
+            else:
+                dx, dy = w.xDimension / 2, w.yDimension / 2
+            x_min, x_max = min(x_min, w.x - dx), max(x_max, w.x + dx)
+            y_min, y_max = min(y_min, w.y - dy), max(y_max, w.y + dy)
+        self._bbox = (x_min, y_min), (x_max, y_max)
+        return self._bbox
+
+    @property
+    def safe_traverse_z(self):
+        """Returns the z-coordinate at which the pipette/tool can safely move between wells of this labware
+
+        :return: The z-coordinate of the top of the tallest well plus :attribute:`Labware.TRAVERSE_CLEARANCE`
+        :rtype: float
+        """
+        if self._safe_traverse_z is None:
+            self._safe_traverse_z = max(w.top_ for w in self) + self.TRAVERSE_CLEARANCE
+        return self._safe_traverse_z
+
+    def contains(self, x: float, y: float):
+        """Checks whether an (x, y) point lies within the bounding box of the labware
+
+        :param x: The x-coordinate of the point
+        :type x: float
+        :param y: The y-coordinate of the point
+        :type y: float
+        :return: True if the point is within :attribute:`Labware.bbox`, False otherwise
+        :rtype: bool
+        """
+        (x_min, y_min), (x_max, y_max) = self.bbox
+        return x_min <= x <= x_max and y_min <= y <= y_max
+
     @property
     def offset(self):
         """Returns the offset of the labware as a tuple of floats
@@ -563,6 +609,7 @@ class Labware(WellSet):
         :type new_offset: Tuple[float]
         """
         self._offset = new_offset
+        self._clear_cache()
         if new_offset is not None:
             for w in self:
                 w.apply_offset(new_offset)
@@ -596,6 +643,7 @@ class Labware(WellSet):
             print("Order needs to be either rows or columns")
 
         self.wells = ordered_wells
+        self._clear_cache()
 
     # @staticmethod
     def _translate_point(
@@ -692,6 +740,7 @@ class Labware(WellSet):
             )
             well.x = new_x
             well.y = new_y
+        self._clear_cache()
         print(f'New manual offset applied to {self.parameters()["loadName"]}')
 
         if save:
@@ -749,11 +798,11 @@ class Labware(WellSet):
         :return: The x, y, z coordinates of the location
         :rtype: float, float, float
         """
-        if type(location) == Well:
+        if isinstance(location, Well):
             x, y, z = location.x, location.y, location.z
-        elif type(location) == tuple:
+        elif isinstance(location, tuple):
             x, y, z = location
-        elif type(location) == Location:
+        elif isinstance(location, Location):
             x, y, z = location._point
         else:
             raise ValueError("Location should be of type Well or Tuple")
@@ -838,6 +887,8 @@ class Location:
     :class:`Labware` or :class:`Well` instance.
     """
 
+    __slots__ = ("_point", "_labware")
+
     def __init__(self, point: Point, labware: Union[Well, Labware]):
 
         self._point = point
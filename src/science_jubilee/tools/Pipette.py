@@ -1,10 +1,14 @@
 import json
 import logging
 import os
-from itertools import dropwhile, takewhile
+from itertools import chain, dropwhile, takewhile
+from math import isclose
 from typing import Iterator, List, Tuple, Union
 
+import numpy as np
+
 from science_jubilee.labware.Labware import Labware, Location, Well
+from science_jubilee.Machine import _G0_V, _G0_XY, _G0_Z, _G2_XY, _G2_XYZ
 from science_jubilee.tools.Tool import (
     Tool,
     ToolConfigurationError,
@@ -14,19 +18,10 @@ from science_jubilee.tools.Tool import (
 
 logger = logging.getLogger(__name__)
 
-
-def tip_check(func):
-    """Decorator to check if the pipette has a tip attached before performing an action."""
-
-    def wrapper(self, *args, **kwargs):
-        if self.has_tip == False:
-            raise ToolStateError(
-                "Error: No tip is attached. Cannot complete this action"
-            )
-        else:
-            func(self, *args, **kwargs)
-
-    return wrapper
+# speed of the plunger when moving to its zero position, in mm/min
+_PRIME_SPEED = 2500
+# height above the deck safe z at which `Pipette.pickup_tip` leaves the pipette, in mm
+_PICKUP_CLEARANCE = 10
 
 
 class Pipette(Tool):
@@ -84,6 +79,10 @@ class Pipette(Tool):
         self.current_well = None
         self.trash = None
         self.is_primed = False
+        # last commanded plunger position, tracked to build G-Code blocks
+        # (None if unknown)
+        self._v_pos = None
+        self._tip_offset = None  # set by `add_tiprack`
 
     @classmethod
     def from_config(
@@ -116,6 +115,16 @@ class Pipette(Tool):
         """Prime the Pipette after loading it onto the Machine sot hat it is ready to use"""
         self.prime()
 
+    def _require_tip(self):
+        """Checks that the pipette has a tip attached before performing an action
+
+        :raises ToolStateError: If the pipette does not have a tip attached
+        """
+        if not self.has_tip:
+            raise ToolStateError(
+                "Error: No tip is attached. Cannot complete this action"
+            )
+
     def vol2move(self, vol):
         """Converts desired volume in uL to a movement of the pipette motor axis
 
@@ -128,7 +137,7 @@ class Pipette(Tool):
 
         return dv
 
-    def prime(self, s=2500):
+    def prime(self, s=_PRIME_SPEED):
         """Moves the plunger to the low-point on the pipette motor axis to prepare for further commands
         Note::This position should not engage the pipette tip plunger
 
@@ -136,8 +145,87 @@ class Pipette(Tool):
         :type s: int
         """
         self._machine.move_to(v=self.zero_position, s=s, wait=True)
+        self._v_pos = self.zero_position
         self.is_primed = True
 
+    def resync_v(self):
+        """Reads the plunger position back from the machine and updates the tracked position
+
+        The plunger position is otherwise tracked from the commanded moves only. Call this method after
+        recovering from an error or if the plunger was moved outside of the :class:`Pipette` methods.
+
+        :return: The current position of the plunger in mm
+        :rtype: float
+        """
+        self._v_pos = float(self._machine.get_position()["V"])
+        return self._v_pos
+
+    def _tracked_v(self):
+        """Returns the tracked plunger position, reading it from the machine if it is not known
+
+        :return: The position of the plunger in mm
+        :rtype: float
+        """
+        if self._v_pos is None:
+            self.resync_v()
+        return self._v_pos
+
+    def _send_block(self, block: list, v_end: float):
+        """Sends a G-Code block to the machine and records the plunger position it ends at
+
+        The tracked position is cleared while the block is sent, so that it is read back from
+        the machine on the next plunger move if sending fails.
+
+        :param block: The G-Code commands to send
+        :type block: list[str]
+        :param v_end: The position of the plunger once the block has been executed
+        :type v_end: float
+        """
+        self._v_pos = None
+        self._machine.send_block(block)
+        self._v_pos = v_end
+
+    def _traverse_gcode(self, x: float, y: float, well, last, s: int = 6000):
+        """Returns the G-Code lines raising the pipette before moving it to (x, y)
+
+        The pipette is raised to the safe height of the deck, unless both the last position and the new
+        position lie within the same labware, in which case it is only raised to :attribute:`Labware.safe_traverse_z`.
+        No line is returned if the pipette is already high enough, as in :method:`Machine.safe_z_movement`.
+
+        :param x: The x-coordinate of the position to move to
+        :type x: float
+        :param y: The y-coordinate of the position to move to
+        :type y: float
+        :param well: The well associated with the position to move to, if any
+        :type well: :class:`Well`
+        :param last: The labware and (x, y, z) coordinates of the last position, each of them None if
+            unknown, or None if the last position is unknown
+        :type last: tuple
+        :param s: The speed of the movement in mm/min, defaults to 6000
+        :type s: int, optional
+        :return: The G-Code lines for the z-movement
+        :rtype: list[str]
+        """
+        if last is None:
+            last = (None, None, None, None)
+        last_labware, last_x, last_y, last_z = last
+
+        safe_z = self._machine.deck.safe_z
+        z = safe_z + 20
+        labware = getattr(well, "_labware", None)
+        if (
+            labware is not None
+            and last_labware is labware
+            and labware.contains(x, y)
+            and labware.contains(last_x, last_y)
+        ):
+            z = min(z, labware.safe_traverse_z)
+            safe_z = min(safe_z, z)
+
+        if last_z is not None and last_z >= safe_z:
+            return []
+        return [_G0_Z(z, s)]
+
     @requires_active_tool
     def _aspirate(self, vol: float, s: int = 2000):
         """Moves the plunger upwards to aspirate liquid into the pipette tip
@@ -153,13 +241,12 @@ class Pipette(Tool):
             self.prime()
 
         dv = self.vol2move(vol) * -1
-        pos = self._machine.get_position()
-        end_pos = float(pos["V"]) + dv
+        end_pos = self._tracked_v() + dv
 
         self._machine.move_to(v=end_pos, s=s)
+        self._v_pos = end_pos
 
     @requires_active_tool
-    @tip_check
     def aspirate(
         self, vol: float, location: Union[Well, Tuple, Location], s: int = 2000
     ):
@@ -173,6 +260,7 @@ class Pipette(Tool):
         :type s: int, optional
         :raises ToolStateError: If the pipette does not have a tip attached
         """
+        self._require_tip()
         x, y, z = Labware._getxyz(location)
 
         if type(location) == Well:
@@ -183,12 +271,10 @@ class Pipette(Tool):
             pass
 
         self._machine.safe_z_movement()
-        self._machine.move_to(x=x, y=y)
-        self._machine.move_to(z=z)
+        self._machine.move_to_xyz(x, y, z)
         self._aspirate(vol, s=s)
 
     @requires_active_tool
-    @tip_check
     def _dispense(self, vol: float, s: int = 2000):
         """Moves the plunger downwards to dispense liquid out of the pipette tip
 
@@ -199,9 +285,9 @@ class Pipette(Tool):
 
         Note:: Ideally the user does not call this functions directly, but instead uses the :method:`dispense` method
         """
+        self._require_tip()
         dv = self.vol2move(vol)
-        pos = self._machine.get_position()
-        end_pos = float(pos["V"]) + dv
+        end_pos = self._tracked_v() + dv
 
         # TODO: Figure out why checks break for transfer, work fine for manually aspirating and dispensing
         # if end_pos > self.zero_position:
@@ -209,9 +295,9 @@ class Pipette(Tool):
         # elif dv > self.zero_position:
         #    raise ToolStateError ("Error : The volume to be dispensed is greater than what was aspirated")
         self._machine.move_to(v=end_pos, s=s)
+        self._v_pos = end_pos
 
     @requires_active_tool
-    @tip_check
     def dispense(
         self, vol: float, location: Union[Well, Tuple, Location], s: int = 2000
     ):
@@ -225,6 +311,7 @@ class Pipette(Tool):
         :type s: int, optional
         :raises ToolStateError: If the pipette does not have a tip attached
         """
+        self._require_tip()
         x, y, z = Labware._getxyz(location)
 
         if type(location) == Well:
@@ -239,8 +326,7 @@ class Pipette(Tool):
             pass
 
         self._machine.safe_z_movement()
-        self._machine.move_to(x=x, y=y)
-        self._machine.move_to(z=z)
+        self._machine.move_to_xyz(x, y, z)
         self._dispense(vol, s=s)
 
     @requires_active_tool
@@ -315,28 +401,36 @@ class Pipette(Tool):
         source_well, destination_well = self._extend_source_target_lists(
             source_well, destination_well
         )
-        targets = zip(source_well, destination_well)
+        # resolve coordinates and wells once so the motion loop only does index lookups
+        source_xyz = np.asarray(
+            [Labware._getxyz(w) for w in source_well], dtype=np.float64
+        )
+        destination_xyz = np.asarray(
+            [Labware._getxyz(w) for w in destination_well], dtype=np.float64
+        )
+        sources = [self._location_well(w) for w in source_well]
+        destinations = [self._location_well(w) for w in destination_well]
         iterations = self._expand_for_volume_contraints(
-            volumes, targets, self.max_volume - air_gap
+            volumes, range(len(source_well)), self.max_volume - air_gap
         )
 
         ## TODO: maybe add TiTracker to pipette class
         TT = self.TipTracker
         TT_dict = TT._tip_stock_mapping
 
-        for step_vol, (source, dest) in iterations:
+        # labware and xyz of the last position, to skip or shorten safe-z moves
+        last = None
+        for step_vol, i in iterations:
             # skip if the volume is zero
             if step_vol == 0:
                 continue
             else:
-                if type(source) == Well:
-                    src = source
-                elif type(source) == Location:
-                    src = source._labware
+                src = sources[i]
+                dst = destinations[i]
 
                 # get coordinates for source and destination wells
-                xs, ys, zs = Labware._getxyz(source)
-                xd, yd, zd = Labware._getxyz(dest)
+                xs, ys, zs = source_xyz[i]
+                xd, yd, zd = destination_xyz[i]
 
                 source_name = f"{src.name}_{src.slot}"
 
@@ -352,18 +446,34 @@ class Pipette(Tool):
                 else:
                     tip = TT.next_tip()
 
-                self.pickup_tip(tip)
-                TT.use_tip(tip)  # note on the TipTracker class that tip is being used
+                if new_tip != "never":
+                    self.pickup_tip(tip)
+                    # note on the TipTracker class that tip is being used
+                    TT.use_tip(tip)
+                    # the tip pickup left the pipette above the deck safe z
+                    z = self._machine.deck.safe_z + _PICKUP_CLEARANCE
+                    last = (None, None, None, z)
 
                 # --------------- Aspirate ----------------
-
-                self._machine.safe_z_movement()
-                self._machine.move_to(x=xs, y=ys)
+                # motion is accumulated in a G-Code block and sent to the machine
+                # in one go
+                xyz_s = 6000  # default speed of `Machine.move_to`
+                v = self._tracked_v() - self.vol2move(step_vol)
+                block = [
+                    "G90",
+                    *self._traverse_gcode(xs, ys, src, last, s=xyz_s),
+                    _G0_XY(xs, ys, xyz_s),
+                    _G0_Z(zs, xyz_s),
+                    _G0_V(v, s),
+                ]
 
                 self.current_well = src
+                last = (getattr(src, "_labware", None), xs, ys, zs)
 
-                self._machine.move_to(z=zs)
-                self._aspirate(step_vol, s=s)
+                if air_gap > 0 or mix_before:
+                    # these steps issue their own commands, so flush the block first
+                    self._send_block(block, v)
+                    block = ["G90"]
 
                 if air_gap > 0:
                     self.air_gap(
@@ -376,16 +486,26 @@ class Pipette(Tool):
                 else:
                     pass
 
+                if air_gap > 0 or mix_before:
+                    v = self._tracked_v()
+                    # the pipette was raised by these steps
+                    last = last[:3] + (None,)
+
                 # --------------- Dispense  ----------------
 
-                self._machine.safe_z_movement()
-                self._machine.move_to(x=xd, y=yd)
-                if type(dest) == Well:
-                    self.current_well = dest
-                elif type(dest) == Location:
-                    self.current_well = dest._labware
-                self._machine.move_to(z=zd)
-                self._dispense(step_vol, s=s)
+                v = v + self.vol2move(step_vol)
+                block.extend(
+                    [
+                        *self._traverse_gcode(xd, yd, dst, last, s=xyz_s),
+                        _G0_XY(xd, yd, xyz_s),
+                        _G0_Z(zd, xyz_s),
+                        _G0_V(v, s),
+                    ]
+                )
+                self._send_block(block, v)
+                if dst is not None:
+                    self.current_well = dst
+                last = (getattr(dst, "_labware", None), xd, yd, zd)
 
                 # mix after dispensing into destination well
                 # check if user indicated a specific well to mix after dispensing
@@ -411,6 +531,10 @@ class Pipette(Tool):
                 else:
                     pass
 
+                if mix_after or blowout:
+                    # the pipette was moved by these steps
+                    last = last[:3] + (None,)
+
                 # --------------- Tip Strategy ----------------
                 if new_tip == "always":
                     self.drop_tip()
@@ -426,6 +550,22 @@ class Pipette(Tool):
                 else:
                     pass
 
+    @staticmethod
+    def _location_well(location: Union[Well, Tuple, Location]):
+        """Returns the :class:`Well` associated with a location, if any
+
+        :param location: The location to get the well from
+        :type location: Union[Well, Tuple, Location]
+        :return: The well, or None if the location is a tuple of coordinates
+        :rtype: :class:`Well`
+        """
+        if isinstance(location, Location):
+            return location._labware
+        elif isinstance(location, Well):
+            return location
+        else:
+            return None
+
     def _create_volume_list(self, volume, total_xfers):
         """Creates a list of volumes to transfer
 
@@ -519,36 +659,38 @@ class Pipette(Tool):
             yield volume, target
 
     @requires_active_tool
-    @tip_check
     def blowout(self, s: int = 6000):
         """Blows out any remaining liquid in the pipette tip
 
         :param s: The speed of the plunger movement in mm/min, defaults to 3000
         :type s: int, optional
         """
+        self._require_tip()
 
         well = self.current_well
         self._machine.move_to(z=well.top_ + 2)
         self._machine.move_to(v=self.blowout_position, s=s)
+        self._v_pos = self.blowout_position
         self.prime()
 
     @requires_active_tool
-    @tip_check
     def air_gap(self, vol):
         """Moves the plunger upwards to aspirate air into the pipette tip
 
         :param vol: The volume of air to aspirate in uL
         :type vol: float
         """
+        self._require_tip()
         # TODO: Add a check to ensure compounded volume does not exceed max volume of pipette
 
         dv = self.vol2move(vol) * -1
         well = self.current_well
         self._machine.move_to(z=well.top_ + 20)
-        self._machine.move(v=-1 * dv)
+        self._machine.move(dv=dv)
+        if self._v_pos is not None:
+            self._v_pos = self._v_pos + dv
 
     @requires_active_tool
-    @tip_check
     def mix(self, vol: float, n: int, s: int = 5500):
         """Mixes liquid by alternating aspirate and dispense steps for the specified number of times
 
@@ -559,20 +701,28 @@ class Pipette(Tool):
         :param s: The speed of the plunger movement in mm/min, defaults to 5000
         :type s: int, optional
         """
-        v = self.vol2move(vol) * -1
-
-        self._machine.move_to(z=self.current_well.top_ + 1)
-        self.prime()
+        self._require_tip()
+        dv = self.vol2move(vol) * -1
 
         # TODO: figure out a better way to indicate mixing height position that is not hardcoded
-        self._machine.move_to(z=self.current_well.bottom_ + 1)
+        block = [
+            "G90",
+            _G0_Z(self.current_well.top_ + 1, 6000),
+            _G0_V(self.zero_position, _PRIME_SPEED),
+            _G0_Z(self.current_well.bottom_ + 1, 6000),
+        ]
+        # all aspirate/prime cycles are queued at once so the planner runs them
+        # back to back
         for i in range(0, n):
-            self._aspirate(vol, s=s)
-            self.prime(s=s)
+            block.append(_G0_V(self.zero_position + dv, s))
+            block.append(_G0_V(self.zero_position, s))
+        block.append("M400")  # wait until the plunger is back at the zero position
+
+        self._send_block(block, self.zero_position)
+        self.is_primed = True
 
     ## In progress (2023-10-12) To test
     @requires_active_tool
-    @tip_check
     def stir(self, n_times: int = 1, height: float = None):
         """Stirs the liquid in the current well by moving the pipette tip in a circular motion
 
@@ -582,6 +732,7 @@ class Pipette(Tool):
         :type height: float, optional
         :raises ToolStateError: If the pipette does not have a tip attached before stirring or if the pipette is not in a well
         """
+        self._require_tip()
         z = self.current_well.z + 0.5  # place pieptte tip close to the bottom
         pos = self._machine.get_position()
         x_ = float(pos["X"])
@@ -589,30 +740,35 @@ class Pipette(Tool):
         z_ = float(pos["Z"])
 
         # check position first
-        if x_ != round(self.current_well.x) and y_ != round(self.current_well.y, 2):
+        if not (
+            isclose(x_, self.current_well.x, abs_tol=0.01)
+            and isclose(y_, self.current_well.y, abs_tol=0.01)
+        ):
             raise ToolStateError(
                 "Error: Pipette shuold be in a well before it can stir"
             )
-        elif z_ != round(z, 2):
-            self._machine.move_to(z=z)
 
         radius = self.current_well.diameter / 2 - (
             self.current_well.diameter / 6
         )  # adjusted so that it does not hit the walls fo the well
 
-        for n in range(n_times):
-            x_sp = self.current_well.x
-            y_sp = self.current_well.y
-            I = -1 * radius
-            J = 0  # keeping same y so relative y difference is 0
-            if height:
-                Z = z + height
-                self._machine.gcode(f"G2 X{x_sp} Y{y_sp} Z{Z} I{I} J{J}")
-                self._machine.gcode(f"M400")  # wait until movement is completed
-                self._machine.move_to(z=z)
-            else:
-                self._machine.gcode(f"G2 X{x_sp} Y{y_sp} I{I} J{J}")
-                self._machine.gcode(f"M400")  # wait until movement is completed
+        x_sp = self.current_well.x
+        y_sp = self.current_well.y
+        I = -1 * radius
+        J = 0  # keeping same y so relative y difference is 0
+
+        # all revolutions are queued at once so the arcs run back to back
+        block = ["G90"]
+        if not isclose(z_, z, abs_tol=0.01):
+            block.append(_G0_Z(z, 6000))
+        if height:
+            Z = z + height
+            block.extend([_G2_XYZ(x_sp, y_sp, Z, I, J), _G0_Z(z, 6000)] * n_times)
+        else:
+            block.extend([_G2_XY(x_sp, y_sp, I, J)] * n_times)
+        block.append("M400")  # wait until movement is completed
+
+        self._machine.send_block(block)
 
     def update_z_offset(self, tip: bool = None):
         """Shift the z-offset of the tool to account for the tip length
@@ -620,13 +776,8 @@ class Pipette(Tool):
         :param tip: Parameter to indicated whether to add or remove the tip offset, defaults to None
         :type tip: bool, optional
         """
-        if isinstance(self.tiprack, list):
-            tip_offset = self.tiprack[0].tip_length - self.tiprack[0].tip_overlap
-        else:
-            tip_offset = self.tiprack.tip_length - self.tiprack.tip_overlap
-
         if tip == True:
-            new_z = self.tool_offset - tip_offset
+            new_z = self.tool_offset - self._tip_offset
         else:
             new_z = self.tool_offset
 
@@ -641,14 +792,13 @@ class Pipette(Tool):
         if type(tiprack) != list:
             tiprack = [tiprack]
 
-        tips = []
-        for rack in tiprack:
-            for t in range(96):
-                tips.append(rack[t])
+        tips = list(chain.from_iterable(tiprack))
 
         self.tips = tips
         self.TipTracker = TipTracker(tips)
         self.tiprack = tiprack
+        # the z-offset added by a tip only depends on the tiprack, so compute it once
+        self._tip_offset = tiprack[0].tip_length - tiprack[0].tip_overlap
 
     @requires_active_tool
     def _pickup_tip(self, z):
@@ -683,14 +833,14 @@ class Pipette(Tool):
             tip_.set_has_tip(False)
             tip_.set_clean_tip(False)
 
-        x, y, z = Labware._getxyz(tip)
+        x, y, z = self.TipTracker.tip_xyz(tip)
         self._machine.safe_z_movement()
         self._machine.move_to(x=x, y=y)
         self._pickup_tip(z)
         self.has_tip = True
         self.update_z_offset(tip=True)
         # # move the plate down( should be + z) for safe movement
-        self._machine.move_to(z=self._machine.deck.safe_z + 10)
+        self._machine.move_to(z=self._machine.deck.safe_z + _PICKUP_CLEARANCE)
 
     @requires_active_tool
     def return_tip(self, location: Well = None):
@@ -701,7 +851,7 @@ class Pipette(Tool):
         """
         if location is None:
             w = self.TipTracker.previous_tip()
-            x, y, z = Labware._getxyz(w)
+            x, y, z = self.TipTracker.tip_xyz(w)
         else:
             if type(location) == Well:
                 w = location
@@ -715,9 +865,8 @@ class Pipette(Tool):
         )  # this will still setthe pipette tip as not clean!
 
         self._machine.safe_z_movement()
-        self._machine.move_to(x=x, y=y)
         # z moves up/down to make sure tip actually makes it into rack
-        self._machine.move_to(z=w.bottom_ + 20)
+        self._machine.move_to_xyz(x, y, w.bottom_ + 20)
         self._drop_tip()
         self.prime()
         self._machine.move_to(z=w.bottom_ + 30)
@@ -725,22 +874,23 @@ class Pipette(Tool):
         self.update_z_offset(tip=False)
 
     @requires_active_tool
-    @tip_check
     def _drop_tip(self):
         """Moves the plunger to eject the pipette tip
 
         :raises ToolConfigurationError: If the pipette does not have a tip attached
         """
+        self._require_tip()
         self._machine.move_to(v=self.drop_tip_position, s=5000)
+        self._v_pos = self.drop_tip_position
 
     @requires_active_tool
-    @tip_check
     def drop_tip(self, location: Union[Well, Tuple] = None):
         """Moves the pipette to the specified location and drops the pipette tip
 
         :param location: The location to drop the tip into
         :type location: Union[:class:`Well`, tuple]
         """
+        self._require_tip()
 
         if location is None and self.trash:
             x, y, z = Labware._getxyz(self.trash)
@@ -772,36 +922,83 @@ class TipTracker:
     Note: This function was taken from the Opentrons API and modified to work with the Pipette class of Science_Jubilee
     """
 
+    __slots__ = (
+        "_wells",
+        "_available_clean_tips",
+        "_tip_stock_mapping",
+    )
+
     def __init__(self, tips, start_well=None):
 
         self._wells = tips[start_well:]
         self._available_clean_tips = tips
         self._tip_stock_mapping = {}
 
+    def __iter__(self):
+        """Iterates over the clean tips left in the tipracks, so that `for tip in tracker` works
+
+        Iterating does not mark the tips as used, this is left to the caller (see :method:`use_tip`).
+
+        :return: An iterator over the clean tips
+        :rtype: Iterator[:class:`Well`]
+        """
+        for tip in self._available_clean_tips:
+            if tip.has_tip and tip.clean_tip == True:
+                yield tip
+
+    def _next_clean_index(self, start_index=0):
+        """Returns the index of the first clean tip in the available tips, starting from `start_index`
+
+        The returned index is equal to the number of available tips if there are no clean tips left.
+        """
+        tips = self._available_clean_tips
+        n = len(tips)
+        index = start_index
+        while index < n and not tips[index].has_tip:
+            index += 1
+        while index < n and not tips[index].clean_tip == True:
+            index += 1
+        return index
+
     def next_tip(self, start_well=None):
         if start_well:
             start_index = self._wells.index(start_well)
-            available_wells = list(
-                dropwhile(
-                    lambda w: not w.has_tip, self._available_clean_tips[start_index:]
-                )
-            )
         else:
-            available_wells = list(
-                dropwhile(lambda w: not w.has_tip, self._available_clean_tips)
-            )
+            start_index = 0
 
-        assert available_wells, "No more available tips"
+        index = self._next_clean_index(start_index)
+        assert index < len(self._available_clean_tips), "No more available tips"
 
-        clean_tips = list(dropwhile(lambda w: not w.clean_tip == True, available_wells))
-        if clean_tips:
-            self._available_clean_tips = clean_tips
-        else:
-            self._available_clean_tips = []
-
-        first_available_well = clean_tips[0]
+        self._available_clean_tips = self._available_clean_tips[index:]
+        first_available_well = self._available_clean_tips[0]
         return first_available_well
 
+    def tip_xyz(self, tip):
+        """Returns the (x, y, z) coordinates of a tip
+
+        The coordinates are read from the tip itself, so they follow any later change of its offset.
+
+        :param tip: The tip to get the coordinates of
+        :type tip: Union[:class:`Well`, tuple, :class:`Location`]
+        :return: The x, y, z coordinates of the tip
+        :rtype: float, float, float
+        """
+        if type(tip) == Well:
+            return tip.x, tip.y, tip.z
+        # e.g. a tuple of coordinates
+        return Labware._getxyz(tip)
+
+    def next_xyz(self):
+        """Returns the coordinates of the next clean tip and marks it as used
+
+        :raises AssertionError: If there are no clean tips left
+        :return: The x, y, z coordinates of the tip
+        :rtype: float, float, float
+        """
+        tip = self.next_tip()
+        self.use_tip(tip)
+        return self.tip_xyz(tip)
+
     def use_tip(self, tip_well):
         tip_well.set_has_tip(False)
         tip_well.set_clean_tip(False)
@@ -810,10 +1007,9 @@ class TipTracker:
 
         drop_leading_filled = list(dropwhile(lambda w: w.has_tip, self._wells))
         first_gap = list(takewhile(lambda w: not w.has_tip, drop_leading_filled))
-        try:
-            return first_gap[-1]
-        except IndexError:
+        if len(first_gap) == 0:
             return None
+        return first_gap[-1]
 
     def return_tip(self, well=None):
         if well.has_tip:
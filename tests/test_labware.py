@@ -0,0 +1,21 @@
+from science_jubilee.labware.Labware import Well
+
+
+def test_well_coordinates_are_floats():
+    well = Well(
+        name="A1", depth=10, totalLiquidVolume=300, shape="circular", x=1, y=2, z=3
+    )
+
+    assert (type(well.x), type(well.y), type(well.z)) == (float, float, float)
+    assert well.diameter is None
+
+
+def test_well_apply_offset():
+    well = Well(
+        name="A1", depth=10, totalLiquidVolume=300, shape="circular", x=1, y=2, z=3
+    )
+
+    well.apply_offset((10, 20, 30))
+
+    assert (well.x, well.y, well.z) == (11.0, 22.0, 33.0)
+    assert (well.bottom_, well.top_) == (33.0, 43.0)
@@ -0,0 +1,214 @@
+import re
+
+import pytest
+
+from science_jubilee.Machine import Machine
+from science_jubilee.tools.Pipette import Pipette
+from science_jubilee.tools.Tool import ToolStateError
+
+
+class FakeDuet:
+    """Records the G-Code sent by a simulated :class:`Machine`"""
+
+    def __init__(self):
+        self.requests = []
+        self.lines = []
+        self.position = {"X": 0.0, "Y": 0.0, "Z": 100.0, "V": 310.0}
+
+    def gcode(self, cmd="", timeout=None, response_wait=30):
+        self.requests.append(cmd)
+        self.lines.extend(cmd.split("\n"))
+        if cmd == "M114":
+            axes = " ".join(f"{k}:{v:.3f}" for k, v in self.position.items())
+            return f"{axes} Count 0 0 0"
+        return ""
+
+    def v_positions(self):
+        """Returns the V-axis position after every G-Code line that moves the plunger"""
+        absolute = True
+        v = None
+        positions = []
+        for line in self.lines:
+            if line == "G90":
+                absolute = True
+            elif line == "G91":
+                absolute = False
+            match = re.search(r"\bV(-?\d+\.?\d*)", line)
+            if line.startswith("G0") and match:
+                value = float(match.group(1))
+                v = value if absolute else v + value
+                positions.append(round(v, 2))
+        return positions
+
+
+@pytest.fixture
+def duet():
+    return FakeDuet()
+
+
+@pytest.fixture
+def machine(duet):
+    machine = Machine(simulated=True, deck_config="lab_automation_deck")
+    machine.gcode = duet.gcode
+    return machine
+
+
+@pytest.fixture
+def pipette(machine):
+    pipette = Pipette.from_config(1, "P300", "P300_config.json")
+    pipette._machine = machine
+    pipette.is_active_tool = True
+    pipette.tool_offset = 0
+    return pipette
+
+
+def test_transfer_with_air_gap(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    pipette.add_tiprack(tiprack)
+    pipette.trash = plate["H12"]
+
+    pipette.transfer(100, plate["A1"], plate["A2"], air_gap=20)
+
+    # prime, aspirate 100 uL, draw a 20 uL air gap, dispense 100 uL, eject the tip,
+    # prime
+    assert duet.v_positions() == [310.0, 219.0, 200.8, 291.8, 425.0, 310.0]
+
+
+def test_transfer_without_air_gap(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    pipette.add_tiprack(tiprack)
+    pipette.trash = plate["H12"]
+
+    pipette.transfer(100, plate["A1"], plate["A2"])
+
+    assert duet.v_positions() == [310.0, 219.0, 310.0, 425.0, 310.0]
+
+
+def test_send_block_splits_long_blocks(machine, duet):
+    lines = [f"G0 V{v:.2f} F2500.00" for v in range(100)]
+
+    machine.send_block(lines)
+
+    assert duet.lines == lines
+    assert len(duet.requests) > 1
+    assert all(len(r) <= machine.MAX_BLOCK_LENGTH for r in duet.requests)
+
+
+def test_pickup_tip_follows_tiprack_offset(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    pipette.add_tiprack(tiprack)
+    tiprack.offset = (1.5, -2.0)
+
+    pipette.pickup_tip()
+
+    xy = f"X{tiprack['A1'].x:.2f} Y{tiprack['A1'].y:.2f}"
+    assert any(line.split() == ["G0", *xy.split(), "F6000.00"] for line in duet.lines)
+
+
+def test_transfer_skips_retract_after_pickup(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    pipette.add_tiprack(tiprack)
+    pipette.trash = plate["H12"]
+
+    pipette.transfer(100, plate["A1"], plate["A2"])
+
+    # the pipette is left above the deck safe z by the tip pickup
+    retract = f"Z{machine.deck.safe_z + 20:.2f}"
+    assert not any(retract in line.split() for line in duet.lines)
+
+
+def test_iterating_tip_tracker_keeps_tips(machine, pipette):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    pipette.add_tiprack(tiprack)
+
+    assert len(list(pipette.TipTracker)) == 96
+    assert pipette.TipTracker.next_tip() is tiprack["A1"]
+
+
+def test_pickup_tip_follows_well_offset(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    pipette.add_tiprack(tiprack)
+    pipette.pickup_tip()
+    pipette.drop_tip(plate["H12"])
+    tip = pipette.TipTracker.next_tip()
+    tip.apply_offset((5, 0))
+
+    pipette.pickup_tip()
+
+    xy = f"X{tip.x:.2f} Y{tip.y:.2f}"
+    assert any(line.split() == ["G0", *xy.split(), "F6000.00"] for line in duet.lines)
+
+
+def test_transfer_within_plate_follows_well_change(machine, pipette, duet):
+    tiprack = machine.load_labware("opentrons_96_tiprack_300ul", 0)
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    pipette.add_tiprack(tiprack)
+    pipette.trash = plate["H12"]
+    plate.safe_traverse_z  # computed before the well changes
+    plate["A2"].z += 30
+
+    pipette.transfer(100, plate["A1"], plate["A2"])
+
+    traverse = f"Z{plate['A2'].top_ + plate.TRAVERSE_CLEARANCE:.2f}"
+    assert any(traverse in line.split() for line in duet.lines)
+
+
+@pytest.fixture
+def in_well(machine, pipette, duet):
+    plate = machine.load_labware("corning_96_wellplate_360ul_flat", 1)
+    well = plate["A1"]
+    pipette.has_tip = True
+    pipette.current_well = well
+    duet.position.update(X=well.x, Y=well.y, Z=well.z + 0.5)
+    return well
+
+
+def test_stir(pipette, duet, in_well):
+    pipette.stir(n_times=3)
+
+    x, y, i = in_well.x, in_well.y, -in_well.diameter / 3
+    arc = f"G2 X{x:.2f} Y{y:.2f} I{i:.2f} J0.00"
+    assert duet.requests[-1].split("\n") == ["G90", arc, arc, arc, "M400"]
+
+
+def test_stir_with_height(pipette, duet, in_well):
+    duet.position.update(Z=50.0)
+
+    pipette.stir(n_times=2, height=2)
+
+    x, y, z, i = in_well.x, in_well.y, in_well.z + 0.5, -in_well.diameter / 3
+    arc = f"G2 X{x:.2f} Y{y:.2f} Z{z + 2:.2f} I{i:.2f} J0.00"
+    down = f"G0 Z{z:.2f} F6000.00"
+    assert duet.requests[-1].split("\n") == ["G90", down, arc, down, arc, down, "M400"]
+
+
+def test_stir_outside_well(pipette, duet, in_well):
+    duet.position.update(X=in_well.x + 1)
+
+    with pytest.raises(ToolStateError):
+        pipette.stir()
+
+
+def test_mix(pipette, duet, in_well):
+    pipette.mix(100, 2)
+
+    # move into the well, prime, then aspirate and dispense 100 uL twice
+    assert duet.v_positions() == [310.0, 219.0, 310.0, 219.0, 310.0]
+    assert len(duet.requests) == 1
+    assert duet.lines[-1] == "M400"
+    assert pipette._v_pos == pipette.zero_position
+
+
+def test_aspirate_dispense_use_tracked_plunger_position(pipette, duet, in_well):
+    pipette.is_primed = True
+
+    pipette._aspirate(100)
+    pipette._dispense(50)
+
+    # the plunger position is unknown at first, so it is read back once
+    assert duet.lines.count("M114") == 1
+    assert duet.v_positions() == [219.0, 264.5]